@@ -11,11 +11,62 @@
 #  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
-from typing import Optional, Tuple
+from functools import lru_cache
+from importlib import import_module
+from operator import eq, gt, lt
+from typing import Callable, Optional, Tuple
 
 from robot.api import logger
 
 
+@lru_cache(maxsize=None)
+def _sql_placeholder(module_name: str) -> str:
+    """
+    Returns the SQL bind-parameter placeholder matching the paramstyle
+    declared by the DB API module - used to build parameterized queries,
+    which the database can plan once and reuse.
+    """
+    try:
+        paramstyle = import_module(module_name).paramstyle
+    except Exception:
+        paramstyle = "format"
+    if paramstyle == "qmark":
+        return "?"
+    if paramstyle in ["numeric", "named"]:
+        return ":1"
+    return "%s"
+
+
+def _sql_placeholder_list(module_name: str, count: int) -> str:
+    """
+    Returns ``count`` comma-separated placeholders for an ``IN (...)`` clause,
+    numbering them for drivers with numeric paramstyle.
+    """
+    placeholder = _sql_placeholder(module_name)
+    if placeholder == ":1":
+        return ", ".join(f":{i + 1}" for i in range(count))
+    return ", ".join([placeholder] * count)
+
+
+_ORACLE_TABLE_EXISTS_SQL = (
+    "SELECT 1 FROM all_objects WHERE object_type IN ('TABLE','VIEW') AND "
+    "owner = SYS_CONTEXT('USERENV', 'SESSION_USER') AND object_name = UPPER({placeholder}) AND ROWNUM = 1"
+)
+_IBM_TABLE_EXISTS_SQL = "SELECT 1 FROM SYSIBM.SYSTABLES WHERE type='T' AND name=UPPER({placeholder}) FETCH FIRST 1 ROW ONLY"
+
+# catalog queries for checking the existence of a table, per DB API module -
+# the table name is passed as a bind parameter, modules not listed here
+# fall back to information_schema
+_TABLE_EXISTS_SQL = {
+    "cx_Oracle": _ORACLE_TABLE_EXISTS_SQL,
+    "oracledb": _ORACLE_TABLE_EXISTS_SQL,
+    "sqlite3": "SELECT 1 FROM sqlite_master WHERE type='table' AND name={placeholder} COLLATE NOCASE LIMIT 1",
+    "ibm_db": _IBM_TABLE_EXISTS_SQL,
+    "ibm_db_dbi": _IBM_TABLE_EXISTS_SQL,
+    "teradata": "SELECT TableName FROM DBC.TablesV WHERE TableKind='T' AND TableName={placeholder}",
+}
+
+
 class Assertion:
     """
     Assertion handles all the assertions of Database Library.
@@ -53,11 +104,60 @@ class Assertion:
         | Check If Exists In Database | SELECT id FROM person WHERE first_name = %s | parameters=${parameters} |
         """
         logger.info(f"Executing : Check If Exists In Database  |  {selectStatement}")
-        if not self.query(selectStatement, sansTran, alias=alias, parameters=parameters):
+        if self._fetch_first_row(selectStatement, sansTran, alias, parameters) is None:
             raise AssertionError(
                 msg or f"Expected to have have at least one row, but got 0 rows from: '{selectStatement}'"
             )
 
+    def _fetch_first_row(
+        self,
+        selectStatement: str,
+        sansTran: bool = False,
+        alias: Optional[str] = None,
+        parameters: Optional[Tuple] = None,
+    ):
+        """
+        Runs the ``selectStatement`` and fetches the first row only -
+        cheaper than `query` when just the existence of a row matters.
+        Returns the row or _None_, if the query returned no rows.
+        """
+        db_connection = self.connection_store.get_connection(alias)
+        cur = None
+        try:
+            cur = db_connection.client.cursor()
+            # only one row is ever consumed - keep the driver from prefetching a full batch
+            cur.arraysize = 1
+            self._execute_sql(cur, selectStatement, parameters=parameters)
+            return cur.fetchone()
+        finally:
+            if cur and not sansTran:
+                db_connection.client.rollback()
+
+    def _fetch_sample_rows(
+        self,
+        selectStatement: str,
+        max_rows: int,
+        sansTran: bool = False,
+        alias: Optional[str] = None,
+        parameters: Optional[Tuple] = None,
+    ):
+        """
+        Runs the ``selectStatement`` and fetches at most ``max_rows`` rows -
+        cheaper than `query` when only a result sample is needed,
+        e.g. for an error message.
+        """
+        db_connection = self.connection_store.get_connection(alias)
+        cur = None
+        try:
+            cur = db_connection.client.cursor()
+            # size the driver fetch batch to the sample, nothing more is consumed
+            cur.arraysize = max_rows
+            self._execute_sql(cur, selectStatement, parameters=parameters)
+            return cur.fetchmany(max_rows)
+        finally:
+            if cur and not sansTran:
+                db_connection.client.rollback()
+
     def check_if_not_exists_in_database(
         self,
         selectStatement: str,
@@ -91,10 +191,12 @@ class Assertion:
         | Check If Not Exists In Database | SELECT id FROM person WHERE first_name = %s | parameters=${parameters} |
         """
         logger.info(f"Executing : Check If Not Exists In Database  |  {selectStatement}")
-        query_results = self.query(selectStatement, sansTran, alias=alias, parameters=parameters)
+        query_results = self._fetch_sample_rows(selectStatement, 6, sansTran, alias, parameters)
         if query_results:
+            sample = query_results[:5]
+            suffix = " (showing first 5 rows)" if len(query_results) > 5 else ""
             raise AssertionError(
-                msg or f"Expected to have have no rows from '{selectStatement}', but got some rows: {query_results}"
+                msg or f"Expected to have have no rows from '{selectStatement}', but got some rows: {sample}{suffix}"
             )
 
     def row_count_is_0(
@@ -129,10 +231,36 @@ class Assertion:
         | Row Count is 0 | SELECT id FROM person WHERE first_name = %s | parameters=${parameters} |
         """
         logger.info(f"Executing : Row Count Is 0  |  {selectStatement}")
-        num_rows = self.row_count(selectStatement, sansTran, alias=alias, parameters=parameters)
-        if num_rows > 0:
+        # probing for the first row lets the database stop at the first match,
+        # the full count is only fetched for the error message
+        if self._fetch_first_row(selectStatement, sansTran, alias, parameters) is not None:
+            num_rows = self.row_count(selectStatement, sansTran, alias=alias, parameters=parameters)
             raise AssertionError(msg or f"Expected 0 rows, but {num_rows} were returned from: '{selectStatement}'")
 
+    def _assert_row_count(
+        self,
+        selectStatement: str,
+        op: Callable[[int, int], bool],
+        numRows,
+        error_template: str,
+        sansTran: bool = False,
+        msg: Optional[str] = None,
+        alias: Optional[str] = None,
+        parameters: Optional[Tuple] = None,
+    ):
+        """
+        Shared body of the `row_count_is_*` keywords: queries the row count
+        and checks it against ``numRows`` using the comparison ``op``,
+        raising an AssertionError built from ``error_template`` (or ``msg``)
+        on mismatch.
+        """
+        expected = int(numRows)
+        num_rows = self.row_count(selectStatement, sansTran, alias=alias, parameters=parameters)
+        if not op(num_rows, expected):
+            raise AssertionError(
+                msg or error_template.format(expected=expected, actual=num_rows, statement=selectStatement)
+            )
+
     def row_count_is_equal_to_x(
         self,
         selectStatement: str,
@@ -165,11 +293,16 @@ class Assertion:
         | Row Count Is Equal To X | SELECT id FROM person WHERE first_name = %s | 0 | parameters=${parameters} |
         """
         logger.info(f"Executing : Row Count Is Equal To X  |  {selectStatement}  |  {numRows}")
-        num_rows = self.row_count(selectStatement, sansTran, alias=alias, parameters=parameters)
-        if num_rows != int(numRows.encode("ascii")):
-            raise AssertionError(
-                msg or f"Expected {numRows} rows, but {num_rows} were returned from: '{selectStatement}'"
-            )
+        self._assert_row_count(
+            selectStatement,
+            eq,
+            numRows,
+            "Expected {expected} rows, but {actual} were returned from: '{statement}'",
+            sansTran,
+            msg,
+            alias,
+            parameters,
+        )
 
     def row_count_is_greater_than_x(
         self,
@@ -203,11 +336,16 @@ class Assertion:
         | Row Count Is Greater Than X | SELECT id FROM person WHERE first_name = %s | 0 | parameters=${parameters} |
         """
         logger.info(f"Executing : Row Count Is Greater Than X  |  {selectStatement}  |  {numRows}")
-        num_rows = self.row_count(selectStatement, sansTran, alias=alias, parameters=parameters)
-        if num_rows <= int(numRows.encode("ascii")):
-            raise AssertionError(
-                msg or f"Expected more than {numRows} rows, but {num_rows} were returned from '{selectStatement}'"
-            )
+        self._assert_row_count(
+            selectStatement,
+            gt,
+            numRows,
+            "Expected more than {expected} rows, but {actual} were returned from '{statement}'",
+            sansTran,
+            msg,
+            alias,
+            parameters,
+        )
 
     def row_count_is_less_than_x(
         self,
@@ -241,11 +379,16 @@ class Assertion:
         | Row Count Is Less Than X | SELECT id FROM person WHERE first_name = %s | 5 | parameters=${parameters} |
         """
         logger.info(f"Executing : Row Count Is Less Than X  |  {selectStatement}  |  {numRows}")
-        num_rows = self.row_count(selectStatement, sansTran, alias=alias, parameters=parameters)
-        if num_rows >= int(numRows.encode("ascii")):
-            raise AssertionError(
-                msg or f"Expected less than {numRows} rows, but {num_rows} were returned from '{selectStatement}'"
-            )
+        self._assert_row_count(
+            selectStatement,
+            lt,
+            numRows,
+            "Expected less than {expected} rows, but {actual} were returned from '{statement}'",
+            sansTran,
+            msg,
+            alias,
+            parameters,
+        )
 
     def table_must_exist(
         self, tableName: str, sansTran: bool = False, msg: Optional[str] = None, alias: Optional[str] = None
@@ -269,31 +412,91 @@ class Assertion:
         """
         logger.info(f"Executing : Table Must Exist  |  {tableName}")
         db_connection = self.connection_store.get_connection(alias)
-        if db_connection.module_name in ["cx_Oracle", "oracledb"]:
-            query = (
-                "SELECT * FROM all_objects WHERE object_type IN ('TABLE','VIEW') AND "
-                f"owner = SYS_CONTEXT('USERENV', 'SESSION_USER') AND object_name = UPPER('{tableName}')"
-            )
-            table_exists = self.row_count(query, sansTran, alias=alias) > 0
-        elif db_connection.module_name in ["sqlite3"]:
-            query = f"SELECT name FROM sqlite_master WHERE type='table' AND name='{tableName}' COLLATE NOCASE"
-            table_exists = self.row_count(query, sansTran, alias=alias) > 0
-        elif db_connection.module_name in ["ibm_db", "ibm_db_dbi"]:
-            query = f"SELECT name FROM SYSIBM.SYSTABLES WHERE type='T' AND name=UPPER('{tableName}')"
-            table_exists = self.row_count(query, sansTran, alias=alias) > 0
-        elif db_connection.module_name in ["teradata"]:
-            query = f"SELECT TableName FROM DBC.TablesV WHERE TableKind='T' AND TableName='{tableName}'"
-            table_exists = self.row_count(query, sansTran, alias=alias) > 0
+        template = _TABLE_EXISTS_SQL.get(db_connection.module_name)
+        if template is not None:
+            query = template.format(placeholder=_sql_placeholder(db_connection.module_name))
+            table_exists = self._fetch_first_row(query, sansTran, alias, (tableName,)) is not None
         else:
-            try:
-                query = f"SELECT * FROM information_schema.tables WHERE table_name='{tableName}'"
-                table_exists = self.row_count(query, sansTran, alias=alias) > 0
-            except:
-                logger.info("Database doesn't support information schema, try using a simple SQL request")
+            table_exists = None
+            # remember per connection whether information schema worked,
+            # so the failing probe is not repeated on every call
+            if getattr(db_connection, "_has_information_schema", True):
+                try:
+                    placeholder = _sql_placeholder(db_connection.module_name)
+                    query = f"SELECT table_name FROM information_schema.tables WHERE table_name={placeholder}"
+                    table_exists = self._fetch_first_row(query, sansTran, alias, (tableName,)) is not None
+                    db_connection._has_information_schema = True
+                except Exception:
+                    logger.info("Database doesn't support information schema, try using a simple SQL request")
+                    db_connection._has_information_schema = False
+            if table_exists is None:
                 try:
                     query = f"SELECT 1 from {tableName} where 1=0"
-                    self.row_count(query, sansTran, alias=alias)
+                    self._fetch_first_row(query, sansTran, alias)
                     table_exists = True
-                except:
+                except Exception:
                     table_exists = False
         assert table_exists, msg or f"Table '{tableName}' does not exist in the db"
+
+    def tables_must_exist(
+        self, *tableNames: str, sansTran: bool = False, msg: Optional[str] = None, alias: Optional[str] = None
+    ):
+        """
+        Check if all the given tables exist in the database -
+        like `table_must_exist`, but all names are checked with a single query.
+
+        Set optional input ``sansTran`` to True to run command without an
+        explicit transaction commit or rollback.
+
+        The default error message can be overridden with the ``msg`` argument.
+
+        Use optional ``alias`` parameter to specify what connection should be used for the query if you have more
+        than one connection open.
+
+        Examples:
+        | Tables Must Exist | person | employee |
+        | Tables Must Exist | person | employee | msg=my error message |
+        | Tables Must Exist | person | employee | alias=my_alias |
+        | Tables Must Exist | person | employee | sansTran=True |
+        """
+        logger.info(f"Executing : Tables Must Exist  |  {', '.join(tableNames)}")
+        if not tableNames:
+            raise ValueError("At least one table name must be provided.")
+        db_connection = self.connection_store.get_connection(alias)
+        module_name = db_connection.module_name
+        if module_name in ["cx_Oracle", "oracledb"]:
+            normalize = str.upper
+            table = "all_objects"
+            column = "object_name"
+            condition = "object_type IN ('TABLE','VIEW') AND owner = SYS_CONTEXT('USERENV', 'SESSION_USER')"
+        elif module_name in ["sqlite3"]:
+            normalize = str.lower
+            table = "sqlite_master"
+            column = "name COLLATE NOCASE"
+            condition = "type='table'"
+        elif module_name in ["ibm_db", "ibm_db_dbi"]:
+            normalize = str.upper
+            table = "SYSIBM.SYSTABLES"
+            column = "name"
+            condition = "type='T'"
+        elif module_name in ["teradata"]:
+            normalize = str
+            table = "DBC.TablesV"
+            column = "TableName"
+            condition = "TableKind='T'"
+        else:
+            normalize = str
+            table = "information_schema.tables"
+            column = "table_name"
+            condition = None
+        names = list(dict.fromkeys(normalize(name) for name in tableNames))
+        placeholders = _sql_placeholder_list(module_name, len(names))
+        query = f"SELECT {column.split()[0]} FROM {table} WHERE "
+        if condition:
+            query += f"{condition} AND "
+        query += f"{column} IN ({placeholders})"
+        rows = self.query(query, sansTran, alias=alias, parameters=tuple(names))
+        found = {normalize(row[0]) for row in rows}
+        missing = [name for name in tableNames if normalize(name) not in found]
+        if missing:
+            raise AssertionError(msg or f"Tables {', '.join(repr(name) for name in missing)} do not exist in the db")
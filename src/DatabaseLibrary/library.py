@@ -0,0 +1,26 @@
+#  Copyright (c) 2010 Franz Allan Valencia See
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+from ._doc import LIBRARY_DOC
+from .assertion import Assertion
+from .connection_manager import ConnectionManager
+from .query import Query
+from .version import VERSION
+
+
+class DatabaseLibrary(ConnectionManager, Query, Assertion):
+    __doc__ = LIBRARY_DOC
+
+    ROBOT_LIBRARY_SCOPE = "GLOBAL"  # Final
+    ROBOT_LIBRARY_VERSION = VERSION  # Final
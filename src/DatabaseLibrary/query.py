@@ -19,6 +19,10 @@ from typing import List, Optional, Tuple
 
 from robot.api import logger
 
+PROC_START_PATTERN = re.compile("create( or replace)? (procedure|function){1}( )?")
+PROC_END_PATTERN = re.compile("end(?!( if;| loop;| case;| while;| repeat;)).*;()?")
+LINE_ENDS_WITH_PROC_END_PATTERN = re.compile(r"(\s|;)" + PROC_END_PATTERN.pattern + "$")
+
 
 class Query:
     """
@@ -83,7 +87,7 @@ class Query:
         try:
             cur = db_connection.client.cursor()
             logger.info(f"Executing : Query  |  {selectStatement} ")
-            self.__execute_sql(cur, selectStatement, parameters=parameters)
+            self._execute_sql(cur, selectStatement, parameters=parameters)
             all_rows = cur.fetchall()
             if returnAsDict:
                 col_names = [c[0] for c in cur.description]
@@ -123,7 +127,7 @@ class Query:
         try:
             cur = db_connection.client.cursor()
             logger.info(f"Executing : Row Count  |  {selectStatement}")
-            self.__execute_sql(cur, selectStatement, parameters=parameters)
+            self._execute_sql(cur, selectStatement, parameters=parameters)
             data = cur.fetchall()
             if db_connection.module_name in ["sqlite3", "ibm_db", "ibm_db_dbi", "pyodbc"]:
                 return len(data)
@@ -172,7 +176,7 @@ class Query:
         try:
             cur = db_connection.client.cursor()
             logger.info("Executing : Description  |  {selectStatement}")
-            self.__execute_sql(cur, selectStatement, parameters=parameters)
+            self._execute_sql(cur, selectStatement, parameters=parameters)
             description = list(cur.description)
             if sys.version_info[0] < 3:
                 for row in range(0, len(description)):
@@ -202,7 +206,7 @@ class Query:
         try:
             cur = db_connection.client.cursor()
             logger.info(f"Executing : Delete All Rows From Table  |  {query}")
-            result = self.__execute_sql(cur, query)
+            result = self._execute_sql(cur, query)
             if result is not None:
                 if not sansTran:
                     db_connection.client.commit()
@@ -286,21 +290,19 @@ class Query:
                 logger.info(f"Executing : Execute SQL Script  |  {sqlScriptFileName}")
                 if not split:
                     logger.info("Statements splitting disabled - pass entire script content to the database module")
-                    self.__execute_sql(cur, sql_file.read())
+                    self._execute_sql(cur, sql_file.read())
                 else:
                     logger.info("Splitting script file into statements...")
                     statements_to_execute = []
                     current_statement = ""
                     inside_statements_group = False
-                    proc_start_pattern = re.compile("create( or replace)? (procedure|function){1}( )?")
-                    proc_end_pattern = re.compile("end(?!( if;| loop;| case;| while;| repeat;)).*;()?")
                     for line in sql_file:
                         line = line.strip()
                         if line.startswith("#") or line.startswith("--") or line == "/":
                             continue
 
                         # check if the line matches the creating procedure regexp pattern
-                        if proc_start_pattern.match(line.lower()):
+                        if PROC_START_PATTERN.match(line.lower()):
                             inside_statements_group = True
                         elif line.lower().startswith("begin"):
                             inside_statements_group = True
@@ -323,9 +325,9 @@ class Query:
                                 # they must persist - even with oracle
                                 sqlFragment += "; "
 
-                            if proc_end_pattern.match(sqlFragment.lower()):
+                            if PROC_END_PATTERN.match(sqlFragment.lower()):
                                 inside_statements_group = False
-                            elif proc_start_pattern.match(sqlFragment.lower()):
+                            elif PROC_START_PATTERN.match(sqlFragment.lower()):
                                 inside_statements_group = True
                             elif sqlFragment.lower().startswith("begin"):
                                 inside_statements_group = True
@@ -350,9 +352,8 @@ class Query:
 
                     for statement in statements_to_execute:
                         logger.info(f"Executing statement from script file: {statement}")
-                        line_ends_with_proc_end = re.compile(r"(\s|;)" + proc_end_pattern.pattern + "$")
-                        omit_semicolon = not line_ends_with_proc_end.search(statement.lower())
-                        self.__execute_sql(cur, statement, omit_semicolon)
+                        omit_semicolon = not LINE_ENDS_WITH_PROC_END_PATTERN.search(statement.lower())
+                        self._execute_sql(cur, statement, omit_semicolon)
                 if not sansTran:
                     db_connection.client.commit()
             finally:
@@ -397,7 +398,7 @@ class Query:
         try:
             cur = db_connection.client.cursor()
             logger.info(f"Executing : Execute SQL String  |  {sqlString}")
-            self.__execute_sql(cur, sqlString, omit_trailing_semicolon=omitTrailingSemicolon, parameters=parameters)
+            self._execute_sql(cur, sqlString, omit_trailing_semicolon=omitTrailingSemicolon, parameters=parameters)
             if not sansTran:
                 db_connection.client.commit()
         finally:
@@ -546,7 +547,7 @@ class Query:
             if cur and not sansTran:
                 db_connection.client.rollback()
 
-    def __execute_sql(
+    def _execute_sql(
         self,
         cur,
         sql_statement: str,
@@ -0,0 +1,27 @@
+import pytest
+
+from DatabaseLibrary.library import DatabaseLibrary
+
+
+@pytest.fixture
+def library():
+    lib = DatabaseLibrary()
+    lib.connect_to_database_using_custom_params("sqlite3", "database=':memory:', isolation_level=None")
+    lib.execute_sql_string("CREATE TABLE person (id INTEGER, first_name TEXT)")
+    lib.execute_sql_string("INSERT INTO person VALUES (1, 'Franz Allan')")
+    yield lib
+    lib.disconnect_from_database()
+
+
+class TestTablesMustExist:
+    def test_all_tables_exist(self, library):
+        library.execute_sql_string("CREATE TABLE employee (id INTEGER)")
+        library.tables_must_exist("person", "EMPLOYEE")
+
+    def test_missing_tables_are_listed(self, library):
+        with pytest.raises(AssertionError, match="Tables 'ghost', 'phantom' do not exist in the db"):
+            library.tables_must_exist("person", "ghost", "phantom")
+
+    def test_no_table_names_given(self, library):
+        with pytest.raises(ValueError, match="At least one table name must be provided."):
+            library.tables_must_exist()